@@ -1,8 +1,10 @@
 """This module implements the INA229 driver."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum, StrEnum
+from struct import Struct
 from typing import ClassVar
 from warnings import warn
 
@@ -10,6 +12,8 @@ from periphery import GPIO, SPI
 
 from iclib.utilities import twos_complement
 
+_UINT16_STRUCT = Struct('>H')
+
 
 class ReadOrWriteType(StrEnum):
     READ = 'R'
@@ -83,10 +87,34 @@ class CONFIGRegisterField(Enum):
         return self.name
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SPIFrame(ABC):
     READ_OR_WRITE_TYPE: ClassVar[ReadOrWriteType]
     register_: Register  # appended underscore due to weird bug in dataclass
+    _control_byte: int = field(init=False, repr=False, compare=False)
+    _data_byte_count: int = field(init=False, repr=False, compare=False)
+    _transmitted_data_bytes: bytes = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            '_control_byte',
+            (self.register_.address << 2) | self.read_or_write_bit,
+        )
+        object.__setattr__(
+            self,
+            '_data_byte_count',
+            self.register_.size // INA229.SPI_WORD_BIT_COUNT,
+        )
+        object.__setattr__(
+            self,
+            '_transmitted_data_bytes',
+            bytes((self._control_byte,)) + self.data_bytes,
+        )
 
     @property
     def read_or_write_bit(self) -> bool:
@@ -94,48 +122,42 @@ class SPIFrame(ABC):
 
     @property
     def control_byte(self) -> int:
-        return (self.register_.address << 2) | self.read_or_write_bit
+        return self._control_byte
 
     @property
     def data_byte_count(self) -> int:
-        return self.register_.size // INA229.SPI_WORD_BIT_COUNT
+        return self._data_byte_count
 
     @property
     def transmitted_data_byte_count(self) -> int:
-        return 1 + self.data_byte_count
+        return 1 + self._data_byte_count
 
     @property
     @abstractmethod
-    def data_bytes(self) -> list[int]:
+    def data_bytes(self) -> bytes:
         pass
 
     @property
-    def transmitted_data_bytes(self) -> list[int]:
-        return [self.control_byte, *self.data_bytes]
+    def transmitted_data_bytes(self) -> bytes:
+        return self._transmitted_data_bytes
 
-    def parse_received_data_bytes(self, data_bytes: list[int]) -> int:
+    def parse_received_data_bytes(self, data_bytes: Sequence[int]) -> int:
         assert len(data_bytes) == self.transmitted_data_byte_count
         assert not data_bytes[0]
 
-        parsed_data = 0
+        return int.from_bytes(data_bytes[-self._data_byte_count:], 'big')
 
-        for data_byte in data_bytes[-self.data_byte_count:]:
-            parsed_data <<= INA229.SPI_WORD_BIT_COUNT
-            parsed_data |= data_byte
 
-        return parsed_data
-
-
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SPIReadFrame(SPIFrame):
     READ_OR_WRITE_TYPE: ClassVar[ReadOrWriteType] = ReadOrWriteType.READ
 
     @property
-    def data_bytes(self) -> list[int]:
-        return [0] * self.data_byte_count
+    def data_bytes(self) -> bytes:
+        return bytes(self.data_byte_count)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SPIWriteFrame(SPIFrame):
     READ_OR_WRITE_TYPE: ClassVar[ReadOrWriteType] = ReadOrWriteType.WRITE
     data: int
@@ -143,12 +165,11 @@ class SPIWriteFrame(SPIFrame):
     def __post_init__(self) -> None:
         assert self.register_.size == 16
 
+        SPIFrame.__post_init__(self)
+
     @property
-    def data_bytes(self) -> list[int]:
-        return [
-            self.data >> INA229.SPI_WORD_BIT_COUNT,
-            self.data & ((1 << INA229.SPI_WORD_BIT_COUNT) - 1),
-        ]
+    def data_bytes(self) -> bytes:
+        return _UINT16_STRUCT.pack(self.data)
 
 
 @dataclass
@@ -173,8 +194,12 @@ class INA229:
     """The alert GPIO."""
     spi: SPI
     """The SPI."""
-    _ADCRANGE: bool = field(default=False, init=False)
-    _SHUNT_CAL: int = field(default=0x1000, init=False)
+    _ADCRANGE: bool = field(init=False)
+    _SHUNT_CAL: int = field(init=False)
+    _VSHUNT_LSB: float = field(init=False)
+    _CURRENT_LSB: float = field(init=False)
+    _POWER_LSB: float = field(init=False)
+    _ENERGY_LSB: float = field(init=False)
 
     def __post_init__(self) -> None:
         if self.spi.mode != self.SPI_MODE:
@@ -189,19 +214,26 @@ class INA229:
         if self.spi.extra_flags:
             warn(f'unknown spi extra flags {self.spi.extra_flags}')
 
-    # Semantic
+        self._ADCRANGE = bool(
+            self.read(Register.CONFIG)
+            & (1 << CONFIGRegisterField.ADCRANGE.bit),
+        )
+        self._SHUNT_CAL = self.read(Register.SHUNT_CAL)
 
-    def spi_communicate(self, *spi_frames: SPIFrame) -> list[int]:
-        transmitted_data_bytes = []
+        self._update_LSBs()
 
-        for spi_frame in spi_frames:
-            transmitted_data_bytes.extend(spi_frame.transmitted_data_bytes)
+    # Semantic
 
+    def spi_communicate(self, *spi_frames: SPIFrame) -> list[int]:
+        transmitted_data_bytes = b''.join(
+            spi_frame.transmitted_data_bytes for spi_frame in spi_frames
+        )
         received_data_bytes = self.spi.transfer(transmitted_data_bytes)
 
-        assert isinstance(received_data_bytes, list)
+        assert isinstance(received_data_bytes, bytes)
         assert len(transmitted_data_bytes) == len(received_data_bytes)
 
+        received_data_bytes_view = memoryview(received_data_bytes)
         parsed_received_data_bytes = []
         begin = 0
 
@@ -210,7 +242,7 @@ class INA229:
 
             parsed_received_data_bytes.append(
                 spi_frame.parse_received_data_bytes(
-                    received_data_bytes[begin:end],
+                    received_data_bytes_view[begin:end],
                 ),
             )
 
@@ -221,10 +253,26 @@ class INA229:
         return parsed_received_data_bytes
 
     def read(self, register: Register) -> int:
-        return self.spi_communicate(SPIReadFrame(register))[0]
+        return self.spi_communicate(_SPI_READ_FRAMES[register])[0]
 
     def write(self, register: Register, data: int) -> int:
-        return self.spi_communicate(SPIWriteFrame(register, data))[0]
+        received_data = self.spi_communicate(SPIWriteFrame(register, data))[0]
+
+        if register == Register.CONFIG:
+            if data & (1 << CONFIGRegisterField.RST.bit):
+                self._ADCRANGE = bool(CONFIGRegisterField.ADCRANGE.reset)
+                self._SHUNT_CAL = 0x1000
+            else:
+                self._ADCRANGE = bool(
+                    data & (1 << CONFIGRegisterField.ADCRANGE.bit),
+                )
+        elif register == Register.SHUNT_CAL:
+            self._SHUNT_CAL = data
+
+        if register in {Register.CONFIG, Register.SHUNT_CAL}:
+            self._update_LSBs()
+
+        return received_data
 
     def reset(self) -> None:
         data = self.read(Register.CONFIG)
@@ -234,15 +282,9 @@ class INA229:
 
     @property
     def shunt_voltage(self) -> float:
-        if self.ADCRANGE:
-            conversion_factor = 78.125
-        else:
-            conversion_factor = 312.5
-
         return (
-            conversion_factor
+            self._VSHUNT_LSB
             * twos_complement(self.read(Register.VSHUNT) >> 4, 20)
-            / 1e9
         )
 
     @property
@@ -263,55 +305,76 @@ class INA229:
 
     @property
     def current(self) -> float:
-        return (
-            self.CURRENT_LSB
-            * twos_complement(self.read(Register.CURRENT) >> 4, 20)
-        )
+        return self._parse_current(self.read(Register.CURRENT))
 
     @property
     def power(self) -> float:
-        return 3.2 * self.CURRENT_LSB * self.read(Register.POWER)
+        return self._parse_power(self.read(Register.POWER))
 
     @property
     def energy(self) -> float:
-        return 16 * 3.2 * self.CURRENT_LSB * self.read(Register.ENERGY)
+        return self._parse_energy(self.read(Register.ENERGY))
 
     @property
     def charge(self) -> float:
+        return self._parse_charge(self.read(Register.CHARGE))
+
+    def sample(self) -> tuple[float, float, float, float]:
+        """Sample the current, power, energy, and charge at once.
+
+        All four result registers are read in a single SPI transfer.
+
+        :return: The current, power, energy, and charge.
+        """
+        CURRENT, POWER, ENERGY, CHARGE = self.spi_communicate(
+            _SPI_READ_FRAMES[Register.CURRENT],
+            _SPI_READ_FRAMES[Register.POWER],
+            _SPI_READ_FRAMES[Register.ENERGY],
+            _SPI_READ_FRAMES[Register.CHARGE],
+        )
+
         return (
-            self.CURRENT_LSB
-            * twos_complement(self.read(Register.CHARGE), 40)
+            self._parse_current(CURRENT),
+            self._parse_power(POWER),
+            self._parse_energy(ENERGY),
+            self._parse_charge(CHARGE),
         )
 
+    def _parse_current(self, CURRENT: int) -> float:
+        return self._CURRENT_LSB * twos_complement(CURRENT >> 4, 20)
+
+    def _parse_power(self, POWER: int) -> float:
+        return self._POWER_LSB * POWER
+
+    def _parse_energy(self, ENERGY: int) -> float:
+        return self._ENERGY_LSB * ENERGY
+
+    def _parse_charge(self, CHARGE: int) -> float:
+        return self._CURRENT_LSB * twos_complement(CHARGE, 40)
+
     # Non-semantic
 
     @property
     def ADCRANGE(self) -> bool:
-        assert (
-            self._ADCRANGE
-            == bool(
-                (
-                    self.read(Register.CONFIG)
-                    & (1 << CONFIGRegisterField.ADCRANGE.bit)
-                ),
-            )
-        )
-
         return self._ADCRANGE
 
     @ADCRANGE.setter
     def ADCRANGE(self, value: bool) -> None:
         CONFIG = self.read(Register.CONFIG)
+        ADCRANGE = bool(CONFIG & (1 << CONFIGRegisterField.ADCRANGE.bit))
+
+        if self._ADCRANGE != ADCRANGE:
+            self._ADCRANGE = ADCRANGE
 
-        if bool(CONFIG & (1 << CONFIGRegisterField.ADCRANGE.bit)) != value:
+            self._update_LSBs()
+
+        if ADCRANGE != value:
             CONFIG ^= 1 << CONFIGRegisterField.ADCRANGE.bit
 
             self.write(Register.CONFIG, CONFIG)
 
     @property
     def SHUNT_CAL(self) -> int:
-        assert self._SHUNT_CAL == self.read(Register.SHUNT_CAL)
-
         return self._SHUNT_CAL
 
     @SHUNT_CAL.setter
@@ -320,9 +383,20 @@ class INA229:
 
     @property
     def CURRENT_LSB(self) -> float:
-        SHUNT_CAL = self.SHUNT_CAL
+        return self._CURRENT_LSB
+
+    def _update_LSBs(self) -> None:
+        SHUNT_CAL = self._SHUNT_CAL
 
-        if self.ADCRANGE:
+        if self._ADCRANGE:
+            self._VSHUNT_LSB = 78.125 / 1e9
             SHUNT_CAL *= 4
+        else:
+            self._VSHUNT_LSB = 312.5 / 1e9
+
+        self._CURRENT_LSB = SHUNT_CAL / (13107.2 * 1e6 * self.R_SHUNT)
+        self._POWER_LSB = 3.2 * self._CURRENT_LSB
+        self._ENERGY_LSB = 16 * self._POWER_LSB
+
 
-        return SHUNT_CAL / (13107.2 * 1e6 * self.R_SHUNT)
+_SPI_READ_FRAMES = {register: SPIReadFrame(register) for register in Register}
@@ -1,14 +1,35 @@
 from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from enum import Enum
+from functools import cache, lru_cache
 from itertools import chain
+from struct import Struct
 from time import sleep as _sleep
 from typing import ClassVar
 from warnings import warn
 
 from periphery import SPI
 
-from iclib.utilities import lsb_bits_to_byte, msb_bits_to_byte
+from iclib.utilities import msb_bits_to_byte
+
+_REGISTER_GROUP_STRUCT = Struct('<HHH')
+
+
+def _get_packet_error_code_table() -> tuple[int, ...]:
+    table = []
+
+    for i in range(1 << 8):
+        remainder = i << 7
+
+        for _ in range(8):
+            if remainder & (1 << 14):
+                remainder = (remainder << 1) ^ 0x4599
+            else:
+                remainder <<= 1
+
+        table.append(remainder & ((1 << 15) - 1))
+
+    return tuple(table)
 
 
 @dataclass
@@ -23,6 +44,10 @@ class LTC6810:
     """The supported spi bit order."""
     SPI_WORD_BIT_COUNT: ClassVar[int] = 8
     """The supported spi number of bits per word."""
+    PACKET_ERROR_CODE_TABLE: ClassVar[tuple[int, ...]] = (
+        _get_packet_error_code_table()
+    )
+    """The byte-wise lookup table for the packet error code (PEC)."""
     spi: SPI
     """The SPI for the ADC device."""
 
@@ -62,6 +87,24 @@ class LTC6810:
 
         return data / 10000
 
+    @classmethod
+    def get_voltages(
+            cls,
+            data_bytes: Iterable[int],
+    ) -> tuple[float, float, float]:
+        """Parse the voltages of a register group from data bytes.
+
+        The data bytes is expected to be of length ``6``, holding three
+        little-endian voltages as parsed by :meth:`get_voltage`.
+
+        :param data_bytes: The register group data bytes (of length
+                           ``6``).
+        :return: The voltage values.
+        """
+        data0, data1, data2 = _REGISTER_GROUP_STRUCT.unpack(bytes(data_bytes))
+
+        return data0 / 10000, data1 / 10000, data2 / 10000
+
     @classmethod
     def get_packet_error_code_bytes(
             cls,
@@ -69,56 +112,46 @@ class LTC6810:
     ) -> tuple[int, int]:
         """Generate packet error code (PEC) from data.
 
-        Refer to Page 55 of LTC6810 datasheet.
+        Refer to Page 55 of LTC6810 datasheet. The bit-serial algorithm
+        in the datasheet is evaluated a byte at a time with
+        :attr:`PACKET_ERROR_CODE_TABLE`.
 
+        :param data_bytes: The data bytes.
         :return: The packet error code bytes.
         """
-        PEC = [False] * 15
-        PEC[4] = True
+        return cls._get_packet_error_code_bytes(tuple(data_bytes))
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _get_packet_error_code_bytes(
+            cls,
+            data_bytes: tuple[int, ...],
+    ) -> tuple[int, int]:
+        PEC = 0b000000000010000
 
         for data_byte in data_bytes:
-            for i in range(7, -1, -1):
-                DIN = bool(data_byte & (1 << i))
-
-                IN0 = DIN ^ PEC[14]
-                IN3 = IN0 ^ PEC[2]
-                IN4 = IN0 ^ PEC[3]
-                IN7 = IN0 ^ PEC[6]
-                IN8 = IN0 ^ PEC[7]
-                IN10 = IN0 ^ PEC[9]
-                IN14 = IN0 ^ PEC[13]
-
-                PEC[14] = IN14
-                PEC[13] = PEC[12]
-                PEC[12] = PEC[11]
-                PEC[11] = PEC[10]
-                PEC[10] = IN10
-                PEC[9] = PEC[8]
-                PEC[8] = IN8
-                PEC[7] = IN7
-                PEC[6] = PEC[5]
-                PEC[5] = PEC[4]
-                PEC[4] = IN4
-                PEC[3] = IN3
-                PEC[2] = PEC[1]
-                PEC[1] = PEC[0]
-                PEC[0] = IN0
-
-        PEC0 = lsb_bits_to_byte(*PEC[7:])
-        PEC1 = lsb_bits_to_byte(*PEC[:7]) << 1
+            address = ((PEC >> 7) ^ data_byte) & ((1 << 8) - 1)
+            PEC = (
+                (PEC << 8) ^ cls.PACKET_ERROR_CODE_TABLE[address]
+            ) & ((1 << 15) - 1)
+
+        PEC0 = PEC >> 7
+        PEC1 = (PEC << 1) & ((1 << 8) - 1)
 
         return PEC0, PEC1
 
     @classmethod
+    @cache
     def get_address_poll_command_bytes(
             cls,
             address: int,
             command: int,
             poll_data_byte_count: int,
-    ) -> list[int]:
+    ) -> bytes:
         """Get address poll command bytes.
 
-        Refer to Page 60 in the Datasheet.
+        Refer to Page 60 in the Datasheet. As the bytes only depend on
+        the arguments, they are cached.
 
         :param address: The device address.
         :param command: The command.
@@ -127,9 +160,9 @@ class LTC6810:
         :return: The address poll command bytes.
         """
         command_bytes = cls.get_address_command_bytes(address, command)
-        poll_data_bytes = ((1 << 8) - 1,) * poll_data_byte_count
+        poll_data_bytes = b'\xff' * poll_data_byte_count
 
-        return list(
+        return bytes(
             chain(
                 command_bytes,
                 cls.get_packet_error_code_bytes(command_bytes),
@@ -143,7 +176,7 @@ class LTC6810:
             address: int,
             command: int,
             data_bytes: Iterable[int],
-    ) -> list[int]:
+    ) -> bytes:
         """Get address write command bytes.
 
         Refer to Page 60 in the Datasheet.
@@ -154,9 +187,9 @@ class LTC6810:
         :return: The address read command bytes.
         """
         command_bytes = cls.get_address_command_bytes(address, command)
-        data_bytes = tuple(data_bytes)
+        data_bytes = bytes(data_bytes)
 
-        return list(
+        return bytes(
             chain(
                 command_bytes,
                 cls.get_packet_error_code_bytes(command_bytes),
@@ -166,22 +199,24 @@ class LTC6810:
         )
 
     @classmethod
+    @cache
     def get_address_read_command_bytes(
             cls,
             address: int,
             command: int,
             data_byte_count: int,
-    ) -> list[int]:
+    ) -> bytes:
         """Get address read command bytes.
 
-        Refer to Page 60 in the Datasheet.
+        Refer to Page 60 in the Datasheet. As the bytes only depend on
+        the arguments, they are cached.
 
         :param address: The device address.
         :param command: The command.
         :param data_byte_count: The number of data bytes to be read.
         :return: The address read command bytes.
         """
-        data_bytes = ((1 << 8) - 1,) * data_byte_count
+        data_bytes = b'\xff' * data_byte_count
 
         return cls.get_address_write_command_bytes(
             address,
@@ -190,6 +225,7 @@ class LTC6810:
         )
 
     @classmethod
+    @cache
     def get_broadcast_command_bytes(cls, command: int) -> tuple[int, int]:
         """Get broadcast command bytes.
 
@@ -204,6 +240,7 @@ class LTC6810:
         return CMD0, CMD1
 
     @classmethod
+    @cache
     def get_address_command_bytes(
             cls,
             address: int,
@@ -339,13 +376,9 @@ class LTC6810:
 
         received_bytes = self.spi.transfer(transmitted_bytes)[-6:]
 
-        assert isinstance(received_bytes, list)
+        assert isinstance(received_bytes, bytes)
 
-        return self.CVAR(
-            self.get_voltage(received_bytes[0:2]),
-            self.get_voltage(received_bytes[2:4]),
-            self.get_voltage(received_bytes[4:6]),
-        )
+        return self.CVAR(*self.get_voltages(received_bytes))
 
     @dataclass
     class CVBR:
@@ -373,13 +406,9 @@ class LTC6810:
 
         received_bytes = self.spi.transfer(transmitted_bytes)[-6:]
 
-        assert isinstance(received_bytes, list)
+        assert isinstance(received_bytes, bytes)
 
-        return self.CVBR(
-            self.get_voltage(received_bytes[0:2]),
-            self.get_voltage(received_bytes[2:4]),
-            self.get_voltage(received_bytes[4:6]),
-        )
+        return self.CVBR(*self.get_voltages(received_bytes))
 
     class CHGMode(Enum):
         """The CHG ADC Modes, as defined in Page 63 of datasheet."""
@@ -496,13 +525,9 @@ class LTC6810:
 
         received_bytes = self.spi.transfer(transmitted_bytes)[-6:]
 
-        assert isinstance(received_bytes, list)
+        assert isinstance(received_bytes, bytes)
 
-        return self.AVAR(
-            self.get_voltage(received_bytes[0:2]),
-            self.get_voltage(received_bytes[2:4]),
-            self.get_voltage(received_bytes[4:6]),
-        )
+        return self.AVAR(*self.get_voltages(received_bytes))
 
     @dataclass
     class AVBR:
@@ -530,13 +555,9 @@ class LTC6810:
 
         received_bytes = self.spi.transfer(transmitted_bytes)[-6:]
 
-        assert isinstance(received_bytes, list)
+        assert isinstance(received_bytes, bytes)
 
-        return self.AVBR(
-            self.get_voltage(received_bytes[0:2]),
-            self.get_voltage(received_bytes[2:4]),
-            self.get_voltage(received_bytes[4:6]),
-        )
+        return self.AVBR(*self.get_voltages(received_bytes))
 
     @dataclass
     class CFGR(Iterable[int]):
@@ -1,6 +1,7 @@
 """This module implements the MCP23S17 driver."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from enum import auto, Enum, IntEnum
 from typing import ClassVar
@@ -356,23 +357,29 @@ class PortRegisterBit(tuple[Port, Register, int], Enum):
     OLATB_OL7 = Port.PORTB, *RegisterBit.OLAT_OL7
 
 
-@dataclass
+@dataclass(slots=True)
 class Operation(ABC):
     READ_OR_WRITE_BIT: ClassVar[int]
     hardware_address: int
     register_address: int
+    control_byte: int = field(init=False, repr=False, compare=False)
+    transmitted_data_byte_count: int = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
-    @property
-    def control_byte(self) -> int:
-        return (
+    def __post_init__(self) -> None:
+        self.control_byte = (
             (0b0100 << 4)
             | (self.hardware_address << 1)
             | self.READ_OR_WRITE_BIT
         )
+        self.transmitted_data_byte_count = 2 + self.data_byte_count
 
     @property
     @abstractmethod
-    def data_bytes(self) -> list[int]:
+    def data_bytes(self) -> bytes:
         pass
 
     @property
@@ -380,42 +387,41 @@ class Operation(ABC):
     def data_byte_count(self) -> int:
         pass
 
-    @property
-    def transmitted_data_bytes(self) -> list[int]:
-        return [self.control_byte, self.register_address, *self.data_bytes]
-
-    @property
-    def transmitted_data_byte_count(self) -> int:
-        return 2 + self.data_byte_count
-
-    def parse_received_data_bytes(
-            self,
-            data_bytes: list[int],
-    ) -> list[int]:
-        return data_bytes[-self.data_byte_count:]
 
-
-@dataclass
+@dataclass(slots=True)
 class Read(Operation):
     READ_OR_WRITE_BIT: ClassVar[int] = 1
     _data_byte_count: int
+    _data_bytes: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        Operation.__post_init__(self)
+
+        self._data_bytes = b'\xff' * self._data_byte_count
 
     @property
-    def data_bytes(self) -> list[int]:
-        return [(1 << MCP23S17.SPI_WORD_BIT_COUNT) - 1] * self.data_byte_count
+    def data_bytes(self) -> bytes:
+        return self._data_bytes
 
     @property
     def data_byte_count(self) -> int:
         return self._data_byte_count
 
 
-@dataclass
+@dataclass(slots=True)
 class Write(Operation):
     READ_OR_WRITE_BIT: ClassVar[int] = 0
-    _data_bytes: list[int]
+    _data_bytes: Iterable[int]
+
+    def __post_init__(self) -> None:
+        self._data_bytes = bytes(self._data_bytes)
+
+        Operation.__post_init__(self)
 
     @property
-    def data_bytes(self) -> list[int]:
+    def data_bytes(self) -> bytes:
+        assert isinstance(self._data_bytes, bytes)
+
         return self._data_bytes
 
     @property
@@ -437,6 +443,10 @@ class MCP23S17:
     """The supported spi bit order."""
     SPI_WORD_BIT_COUNT: ClassVar[int] = 8
     """The supported spi number of bits per word."""
+    VOLATILE_REGISTERS: ClassVar[frozenset[Register]] = frozenset(
+        {Register.INTF, Register.INTCAP, Register.GPIO},
+    )
+    """The registers whose values can change without being written."""
     hardware_reset_gpio: GPIO
     """The hardware reset GPIO."""
     interrupt_output_a_gpio: GPIO
@@ -448,6 +458,8 @@ class MCP23S17:
     hardware_address: int = 0
     """The hardware address."""
     _mode: Mode = field(default=Mode.SIXTEEN_BIT_MODE, init=False)
+    _sequential_operation: bool = field(default=True, init=False)
+    _cache: dict[int, int] = field(default_factory=dict, init=False)
 
     def __post_init__(self) -> None:
         if self.spi.mode not in self.SPI_MODES:
@@ -475,37 +487,190 @@ class MCP23S17:
 
         self._mode = value
 
-    def operate(self, *operations: Operation) -> list[int]:
-        transmitted_data_bytes = []
+        self._cache.clear()
 
-        for operation in operations:
-            transmitted_data_bytes.extend(operation.transmitted_data_bytes)
+    @property
+    def sequential_operation(self) -> bool:
+        return self._sequential_operation
+
+    @sequential_operation.setter
+    def sequential_operation(self, value: bool) -> None:
+        self.write_bit(
+            *PortRegisterBit.IOCONA_SEQOP,  # type: ignore[call-arg]
+            not value,
+        )
 
+        self._sequential_operation = value
+
+    def operate(self, *operations: Operation) -> list[int]:
+        if self.sequential_operation:
+            operations = self._coalesce(operations)
+
+        transmitted_data_bytes, spans = self._pack(operations)
         received_data_bytes = self.spi.transfer(transmitted_data_bytes)
 
-        assert isinstance(received_data_bytes, list)
+        assert isinstance(received_data_bytes, bytearray)
+
+        parsed_received_data_bytes: list[int] = []
 
-        parsed_received_data_bytes = []
+        for operation, (begin, end) in zip(operations, spans):
+            data_bytes = received_data_bytes[begin:end]
+
+            parsed_received_data_bytes.extend(data_bytes)
+
+            if operation.hardware_address != self.hardware_address:
+                continue
+            elif isinstance(operation, Write):
+                self._update_cache(
+                    operation.register_address,
+                    operation.data_bytes,
+                    True,
+                )
+            else:
+                self._update_cache(
+                    operation.register_address,
+                    data_bytes,
+                    False,
+                )
+
+        return parsed_received_data_bytes
+
+    def _get_register_addresses(
+            self,
+            register_address: int,
+            data_byte_count: int,
+    ) -> list[int]:
+        if self.sequential_operation:
+            register_addresses = list(
+                range(register_address, register_address + data_byte_count),
+            )
+        elif self.mode == Mode.SIXTEEN_BIT_MODE:
+            register_addresses = [
+                register_address ^ (i & 1) for i in range(data_byte_count)
+            ]
+        else:
+            register_addresses = [register_address] * data_byte_count
+
+        return register_addresses
+
+    def _update_cache(
+            self,
+            register_address: int,
+            data_bytes: Sequence[int],
+            written: bool,
+    ) -> None:
+        addresses = self._get_register_addresses(
+            register_address,
+            len(data_bytes),
+        )
+
+        for address, data_byte in zip(addresses, data_bytes):
+            try:
+                port, register = self.get_port_register(address)
+            except ValueError:
+                continue
+
+            if register == Register.IOCON:
+                for iocon_port in Port:
+                    self._cache[
+                        self.get_register_address(iocon_port, register)
+                    ] = data_byte
+            elif register == Register.GPIO:
+                if written:
+                    self._cache[
+                        self.get_register_address(port, Register.OLAT)
+                    ] = data_byte
+            elif register not in self.VOLATILE_REGISTERS:
+                self._cache[address] = data_byte
+
+    def _coalesce(
+            self,
+            operations: tuple[Operation, ...],
+    ) -> tuple[Operation, ...]:
+        coalesced_operations: list[Operation] = []
+
+        for operation in operations:
+            previous_operation = (
+                coalesced_operations[-1] if coalesced_operations else None
+            )
+
+            if (
+                    previous_operation is None
+                    or (
+                        previous_operation.hardware_address
+                        != operation.hardware_address
+                    )
+                    or (
+                        previous_operation.register_address
+                        + previous_operation.data_byte_count
+                        != operation.register_address
+                    )
+            ):
+                coalesced_operations.append(operation)
+            elif (
+                    isinstance(previous_operation, Read)
+                    and isinstance(operation, Read)
+            ):
+                coalesced_operations[-1] = Read(
+                    previous_operation.hardware_address,
+                    previous_operation.register_address,
+                    (
+                        previous_operation.data_byte_count
+                        + operation.data_byte_count
+                    ),
+                )
+            elif (
+                    isinstance(previous_operation, Write)
+                    and isinstance(operation, Write)
+            ):
+                coalesced_operations[-1] = Write(
+                    previous_operation.hardware_address,
+                    previous_operation.register_address,
+                    previous_operation.data_bytes + operation.data_bytes,
+                )
+            else:
+                coalesced_operations.append(operation)
+
+        return tuple(coalesced_operations)
+
+    def _pack(
+            self,
+            operations: tuple[Operation, ...],
+    ) -> tuple[bytearray, list[tuple[int, int]]]:
+        transmitted_data_bytes = bytearray(
+            sum(
+                operation.transmitted_data_byte_count
+                for operation in operations
+            ),
+        )
+        spans = []
         begin = 0
 
         for operation in operations:
             end = begin + operation.transmitted_data_byte_count
+            transmitted_data_bytes[begin] = operation.control_byte
+            transmitted_data_bytes[begin + 1] = operation.register_address
+            transmitted_data_bytes[begin + 2:end] = operation.data_bytes
 
-            parsed_received_data_bytes.extend(
-                operation.parse_received_data_bytes(
-                    received_data_bytes[begin:end],
-                ),
-            )
+            spans.append((begin + 2, end))
 
             begin = end
 
-        return parsed_received_data_bytes
+        return transmitted_data_bytes, spans
 
     def read(
             self,
             register_address: int,
             data_byte_count: int,
     ) -> list[int]:
+        addresses = self._get_register_addresses(
+            register_address,
+            data_byte_count,
+        )
+
+        if all(address in self._cache for address in addresses):
+            return [self._cache[address] for address in addresses]
+
         return self.operate(
             Read(self.hardware_address, register_address, data_byte_count),
         )
@@ -513,7 +678,7 @@ class MCP23S17:
     def write(
             self,
             register_address: int,
-            data_bytes: list[int],
+            data_bytes: Iterable[int],
     ) -> list[int]:
         return self.operate(
             Write(self.hardware_address, register_address, data_bytes),
@@ -527,6 +692,19 @@ class MCP23S17:
 
         return register_address
 
+    def get_port_register(
+            self,
+            register_address: int,
+    ) -> tuple[Port, Register]:
+        if self.mode == Mode.SIXTEEN_BIT_MODE:
+            port = Port.PORTB if register_address & 1 else Port.PORTA
+            register = Register(register_address >> 1)
+        else:
+            port = Port.PORTB if register_address & 0x10 else Port.PORTA
+            register = Register(register_address & ~0x10)
+
+        return port, register
+
     def read_register(
             self,
             port: Port,
@@ -542,7 +720,7 @@ class MCP23S17:
             self,
             port: Port,
             register: Register,
-            data_bytes: list[int],
+            data_bytes: Iterable[int],
     ) -> list[int]:
         return self.write(
             self.get_register_address(port, register),
@@ -1,5 +1,4 @@
 from dataclasses import dataclass
-from math import floor
 from typing import ClassVar
 from warnings import warn
 
@@ -62,10 +61,23 @@ class NHDC12864A1ZFSWFBWHTT:
         if self.spi.extra_flags:
             warn(f'unknown spi extra flags {self.spi.extra_flags}')
 
-        self.framebuffer = [0x0 for i in range(64 * 16)]
+        self.framebuffer = bytearray(self.WIDTH * self.HEIGHT // 8)
+        self._display_start_commands = bytes(
+            (self.DISPLAY_OFF, self.DISPLAY_START_ADDRESS),
+        )
+        self._page_commands = tuple(
+            bytes((self.BASE_PAGE + page, 0x10, 0x00))
+            for page in range(self.HEIGHT >> 3)
+        )
+        self._display_end_commands = bytes(
+            (self.DISPLAY_ON, self.TURN_POINTS_ON, self.REVERT_NORMAL),
+        )
+        self._dirty_begins = [0] * len(self._page_commands)
+        self._dirty_ends = [self.WIDTH] * len(self._page_commands)
         self.face = None
         self.font_width = -1
         self.font_height = -1
+        self._glyphs: dict[str, tuple[list[int], int]] = {}
 
     def reset(self) -> None:
         """Resets everything in the display.
@@ -74,6 +86,7 @@ class NHDC12864A1ZFSWFBWHTT:
         """
         self.reset_pin.write(False)
         self.reset_pin.write(True)
+        self.mark_dirty()
 
     def configure(self) -> None:
         """Configures the diplay for normal operation.
@@ -83,17 +96,19 @@ class NHDC12864A1ZFSWFBWHTT:
         self.reset()
         self.a0_pin.write(False)
         self.spi.transfer(
-            [
-                0xA0,              # ADC select.
-                self.DISPLAY_OFF,  # Display OFF.
-                0xC8,              # COM direction scan.
-                0xA2,              # LCD bias set.
-                0x2F,              # Power Control set.
-                0x26,              # Resistor Ratio Set.
-                0x81,              # Electronic Volume Command (set contrast).
-                0x11,              # Electronic Volume value (contrast value).
-                self.DISPLAY_ON,   # Display ON
-            ]
+            bytes(
+                [
+                    0xA0,              # ADC select.
+                    self.DISPLAY_OFF,  # Display OFF.
+                    0xC8,              # COM direction scan.
+                    0xA2,              # LCD bias set.
+                    0x2F,              # Power Control set.
+                    0x26,              # Resistor Ratio Set.
+                    0x81,              # Electronic Volume Command (contrast).
+                    0x11,              # Electronic Volume value (contrast).
+                    self.DISPLAY_ON,   # Display ON
+                ],
+            ),
         )
 
     def clear_screen(self) -> None:
@@ -101,43 +116,67 @@ class NHDC12864A1ZFSWFBWHTT:
 
         :return: ``None``.
         """
-        for i in range(len(self.framebuffer)):
-            self.framebuffer[i] = 0x00
+        self.framebuffer[:] = bytes(len(self.framebuffer))
 
+        self.mark_dirty()
         self.display()
 
     def display(self) -> None:
         """Writes what is in the local framebuffer to the display
         memory.
 
+        Only the columns of each page that changed through the drawing
+        methods since the last call are sent. After editing
+        :attr:`framebuffer` directly, call :meth:`mark_dirty` first.
+
         :return: ``None``.
         """
-        index = 0
-        # Write LCD pixel data
-        page = self.BASE_PAGE
-        self.spi.transfer([self.DISPLAY_OFF, self.DISPLAY_START_ADDRESS])
+        self.a0_pin.write(False)
+        self.spi.transfer(self._display_start_commands)
 
-        for i in range(8):
-            self.spi.transfer([page, 0x10, 0x00])
+        for page in range(len(self._page_commands)):
+            begin = self._dirty_begins[page]
+            end = self._dirty_ends[page]
+
+            if begin >= end:
+                continue
+
+            offset = page * self.WIDTH
+
+            self.spi.transfer(self._get_address_commands(page, begin))
             self.a0_pin.write(True)
-            self.spi.transfer(
-                [
-                    self.framebuffer[i + index * self.WIDTH]
-                    for i in range(self.WIDTH)
-                ],
-            )
+            self.spi.transfer(self.framebuffer[offset + begin:offset + end])
             self.a0_pin.write(False)
-            page += 1
-            index += 1
 
-        self.spi.transfer(
-            [
-                self.DISPLAY_ON,
-                self.TURN_POINTS_ON,
-                self.REVERT_NORMAL,
-            ],
+            self._dirty_begins[page] = self.WIDTH
+            self._dirty_ends[page] = 0
+
+        self.spi.transfer(self._display_end_commands)
+
+    def mark_dirty(self) -> None:
+        """Marks the whole framebuffer as changed so that the next
+        :meth:`display` call sends all of it.
+
+        :return: ``None``.
+        """
+        self._dirty_begins[:] = [0] * len(self._dirty_begins)
+        self._dirty_ends[:] = [self.WIDTH] * len(self._dirty_ends)
+
+    def _get_address_commands(self, page: int, column: int) -> bytes:
+        if not column:
+            return self._page_commands[page]
+
+        return bytes(
+            (self.BASE_PAGE + page, 0x10 | (column >> 4), column & 0x0F),
         )
 
+    def _mark_dirty_columns(self, page: int, begin: int, end: int) -> None:
+        if begin < self._dirty_begins[page]:
+            self._dirty_begins[page] = begin
+
+        if end > self._dirty_ends[page]:
+            self._dirty_ends[page] = end
+
     def framebuffer_offset(self, x: int, y: int) -> int:
         """Returns the flattened index in the framebuffer given an ``x``
         and ``y`` coordinate.
@@ -146,7 +185,7 @@ class NHDC12864A1ZFSWFBWHTT:
         :param y: The ``y`` coordinate.
         :return: The framebuffer offset.
         """
-        return x + 128 * floor(y / 8)
+        return x + self.WIDTH * (y >> 3)
 
     def page_offset(self, x: int, y: int) -> int:
         """Returns the page ``(1-8)`` given a coordinate on the display.
@@ -155,7 +194,7 @@ class NHDC12864A1ZFSWFBWHTT:
         :param y: The ``y`` coordinate.
         :return: The page offset.
         """
-        return floor(y / 8)
+        return y >> 3
 
     def write_pixel(self, x: int, y: int) -> None:
         """Turn on pixel at ``(x, y)`` in the framebuffer. This is does
@@ -165,8 +204,12 @@ class NHDC12864A1ZFSWFBWHTT:
         :param y: The ``y`` coordinate.
         :return: ``None``.
         """
-        i = self.framebuffer_offset(x, y)
-        self.framebuffer[i] = self.framebuffer[i] | (1 << (y % 8))
+        if not (0 <= x < self.WIDTH and 0 <= y < self.HEIGHT):
+            return
+
+        self.framebuffer[x + self.WIDTH * (y >> 3)] |= 1 << (y & 7)
+
+        self._mark_dirty_columns(y >> 3, x, x + 1)
 
     def write_pixel_immediate(self, x: int, y: int) -> None:
         """Write to framebuffer and update display.
@@ -175,13 +218,16 @@ class NHDC12864A1ZFSWFBWHTT:
         :param y: The ``y`` coordinate.
         :return: ``None``.
         """
+        if not self.pixel_in_bounds(x, y):
+            return
+
         i = self.framebuffer_offset(x, y)
-        page = self.BASE_PAGE + self.page_offset(x, y)
+        page = self.page_offset(x, y)
         self.write_pixel(x, y)
 
-        self.spi.transfer([page, 0x10, 0x00])
+        self.spi.transfer(self._get_address_commands(page, x))
         self.a0_pin.write(True)
-        self.spi.transfer([self.framebuffer[i]])
+        self.spi.transfer(self.framebuffer[i:i + 1])
         self.a0_pin.write(False)
 
     def clear_pixel(self, x: int, y: int) -> None:
@@ -193,8 +239,12 @@ class NHDC12864A1ZFSWFBWHTT:
         :param y: The ``y`` coordinate.
         :return: ``None``.
         """
-        i = self.framebuffer_offset(x, y)
-        self.framebuffer[i] = self.framebuffer[i] & ~(1 << (y % 8))
+        if not (0 <= x < self.WIDTH and 0 <= y < self.HEIGHT):
+            return
+
+        self.framebuffer[x + self.WIDTH * (y >> 3)] &= ~(1 << (y & 7))
+
+        self._mark_dirty_columns(y >> 3, x, x + 1)
 
     def clear_pixel_immediate(self, x: int, y: int) -> None:
         """Write to framebuffer and update display.
@@ -203,13 +253,16 @@ class NHDC12864A1ZFSWFBWHTT:
         :param y: The ``y`` coordinate.
         :return: ``None``.
         """
+        if not self.pixel_in_bounds(x, y):
+            return
+
         i = self.framebuffer_offset(x, y)
-        page = self.BASE_PAGE + self.page_offset(x, y)
+        page = self.page_offset(x, y)
         self.clear_pixel(x, y)
 
-        self.spi.transfer([page, 0x10, 0x00])
+        self.spi.transfer(self._get_address_commands(page, x))
         self.a0_pin.write(True)
-        self.spi.transfer([self.framebuffer[i]])
+        self.spi.transfer(self.framebuffer[i:i + 1])
         self.a0_pin.write(False)
 
     def draw_fill_rect(self, x: int, y: int, width: int, height: int) -> None:
@@ -227,9 +280,7 @@ class NHDC12864A1ZFSWFBWHTT:
         ):
             return
 
-        for row in range(height):
-            for col in range(width):
-                self.write_pixel(x + col, y + row)
+        self._fill_rect(x, y, width, height)
 
     def draw_rect(self, x: int, y: int, width: int, height: int) -> None:
         """Draw a hollow rectangle.
@@ -246,13 +297,22 @@ class NHDC12864A1ZFSWFBWHTT:
         ):
             return
 
-        for row in range(height):
-            self.write_pixel(x, y + row)
-            self.write_pixel(x + width - 1, y + row)
+        self._fill_rect(x, y, 1, height)
+        self._fill_rect(x + width - 1, y, 1, height)
+        self._fill_rect(x, y, width, 1)
+        self._fill_rect(x, y + height - 1, width, 1)
+
+    def _fill_rect(self, x: int, y: int, width: int, height: int) -> None:
+        for page in range(y >> 3, ((y + height - 1) >> 3) + 1):
+            top = max(y - (page << 3), 0)
+            bottom = min(y + height - (page << 3), 8)
+            mask = ((1 << (bottom - top)) - 1) << top
+            begin = page * self.WIDTH + x
+
+            for i in range(begin, begin + width):
+                self.framebuffer[i] |= mask
 
-        for col in range(width):
-            self.write_pixel(x + col, y)
-            self.write_pixel(x + col, y + height - 1)
+            self._mark_dirty_columns(page, x, x + width)
 
     def set_font(self, filename: str) -> None:
         """Set the font for drawing letters.
@@ -262,11 +322,13 @@ class NHDC12864A1ZFSWFBWHTT:
         """
         self.face = Face(filename)
 
+        self._glyphs.clear()
+
     def pixel_in_bounds(self, x: int, y: int) -> bool:
         """Checks if the x and y coordinate is
         within the bounds of the display resolution.
         """
-        return x >= 0 and x <= self.WIDTH and y >= 0 and y <= self.HEIGHT
+        return 0 <= x < self.WIDTH and 0 <= y < self.HEIGHT
 
     def set_size(self, width: int, height: int) -> None:
         """Set the size of the letters.
@@ -283,6 +345,8 @@ class NHDC12864A1ZFSWFBWHTT:
         self.font_width = width
         self.font_height = height
 
+        self._glyphs.clear()
+
     def draw_letter(self, letter: str, x: int, y: int) -> None:
         """Draw the letter at position ``(x, y)``.
 
@@ -294,25 +358,77 @@ class NHDC12864A1ZFSWFBWHTT:
             self.face is None
             or (
                 not self.pixel_in_bounds(
-                    x + self.font_width,
-                    y + self.font_height,
+                    x + self.font_width - 1,
+                    y + self.font_height - 1,
                 )
             )
         ):
             return
 
+        glyph = self._glyphs.get(letter)
+
+        if glyph is None:
+            glyph = self._glyphs[letter] = self._load_glyph(letter)
+
+        self._blit_columns(*glyph, x, y)
+
+    def _load_glyph(self, letter: str) -> tuple[list[int], int]:
+        assert self.face is not None
+
         self.face.load_char(letter)
         bitmap = self.face.glyph.bitmap
+        columns = [0] * bitmap.width
 
         for row in range(bitmap.rows):
-            for col in range(bitmap.width):
-                if x + col >= self.WIDTH or y + row >= self.HEIGHT:
-                    continue
+            offset = row * bitmap.pitch
+            samples = bitmap.buffer[offset:offset + bitmap.width]
+
+            for col, sample in enumerate(samples):
+                if sample:
+                    columns[col] |= 1 << row
+
+        return columns, bitmap.rows
+
+    def _blit_columns(
+            self,
+            columns: list[int],
+            height: int,
+            x: int,
+            y: int,
+    ) -> None:
+        begin_row = max(0, -y)
+        end_row = min(height, self.HEIGHT - y)
+
+        if begin_row >= end_row:
+            return
+
+        begin_col = max(0, -x)
+        end_col = min(len(columns), self.WIDTH - x)
+
+        if begin_col >= end_col:
+            return
 
-                if bitmap.buffer[row * bitmap.pitch + col]:
-                    self.write_pixel(x + col, y + row)
-                else:
-                    self.clear_pixel(x + col, y + row)
+        top = y + begin_row
+        shift = top & 7
+        row_mask = (1 << (end_row - begin_row)) - 1
+        base = self.WIDTH * (top >> 3)
+
+        for page in range(top >> 3, ((y + end_row - 1) >> 3) + 1):
+            self._mark_dirty_columns(page, x + begin_col, x + end_col)
+
+        for col in range(begin_col, end_col):
+            column = ((columns[col] >> begin_row) & row_mask) << shift
+            mask = row_mask << shift
+            index = base + x + col
+
+            while mask:
+                self.framebuffer[index] = (
+                    (self.framebuffer[index] & ~mask & 0xFF)
+                    | (column & 0xFF)
+                )
+                column >>= 8
+                mask >>= 8
+                index += self.WIDTH
 
     def draw_word(self, word: str, x: int, y: int) -> None:
         """Draws the word while wrapping if offscreen.
@@ -324,25 +440,25 @@ class NHDC12864A1ZFSWFBWHTT:
         """
         if (
                 self.face is None
+                or self.font_width <= 0
+                or self.font_height <= 0
                 or (
                     not self.pixel_in_bounds(
-                        x + self.font_width,
-                        y + self.font_height,
+                        x + self.font_width - 1,
+                        y + self.font_height - 1,
                     )
                 )
         ):
             return
 
-        x_off = x
-        y_off = y
-
-        for letter in word:
-            if y_off + self.font_height >= self.HEIGHT:
-                break
+        column_count = (self.WIDTH - x) // self.font_width
+        row_count = (self.HEIGHT - y) // self.font_height
 
-            if x_off + self.font_width >= self.WIDTH:
-                x_off = x
-                y_off += self.font_height
+        for i, letter in enumerate(word[:column_count * row_count]):
+            row, column = divmod(i, column_count)
 
-            self.draw_letter(letter, x_off, y_off)
-            x_off += self.font_width
+            self.draw_letter(
+                letter,
+                x + column * self.font_width,
+                y + row * self.font_height,
+            )
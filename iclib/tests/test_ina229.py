@@ -1,7 +1,7 @@
 from unittest import TestCase, main
-from unittest.mock import MagicMock
+from unittest.mock import call, MagicMock
 
-from iclib.ina229 import INA229
+from iclib.ina229 import INA229, Register
 
 
 class INA229TestCase(TestCase):
@@ -15,8 +15,151 @@ class INA229TestCase(TestCase):
             bits_per_word=INA229.SPI_WORD_BIT_COUNT,
             extra_flags=0,
         )
+        mock_spi.transfer.side_effect = [
+            bytes([0x00, 0x00, 0x10]),
+            bytes([0x00, 0x20, 0x00]),
+        ]
+        ina229 = INA229(R_SHUNT, alert_gpio, mock_spi)
 
-        INA229(R_SHUNT, alert_gpio, mock_spi)
+        self.assertTrue(ina229.ADCRANGE)
+        self.assertEqual(ina229.SHUNT_CAL, 0x2000)
+        self.assertAlmostEqual(
+            ina229.CURRENT_LSB / (4 * 0x2000 / (13107.2 * 1e6 * R_SHUNT)),
+            1,
+        )
+        self.assertEqual(
+            mock_spi.transfer.call_args_list,
+            [
+                call(bytes([0b00000001, 0x00, 0x00])),
+                call(bytes([0b00001001, 0x00, 0x00])),
+            ],
+        )
+
+    def test_spi_communicate(self) -> None:
+        R_SHUNT = 100
+        alert_gpio = MagicMock()
+        mock_spi = MagicMock(
+            mode=INA229.SPI_MODE,
+            max_speed=INA229.MAX_SPI_MAX_SPEED,
+            bit_order=INA229.SPI_BIT_ORDER,
+            bits_per_word=INA229.SPI_WORD_BIT_COUNT,
+            extra_flags=0,
+        )
+        mock_spi.transfer.return_value = bytes([0x00, 0x10, 0x00])
+        ina229 = INA229(R_SHUNT, alert_gpio, mock_spi)
+        mock_spi.reset_mock()
+        mock_spi.transfer.return_value = bytes(
+            [0x00, 0x12, 0x34, 0x56],
+        )
+
+        self.assertEqual(ina229.read(Register.VBUS), 0x123456)
+        mock_spi.transfer.assert_called_once_with(
+            bytes([0b00010101, 0x00, 0x00, 0x00]),
+        )
+        mock_spi.reset_mock()
+
+        mock_spi.transfer.return_value = bytes(3)
+
+        self.assertEqual(ina229.write(Register.SHUNT_CAL, 0x1234), 0)
+        mock_spi.transfer.assert_called_once_with(
+            bytes([0b00001000, 0x12, 0x34]),
+        )
+
+    def test_configuration_cache(self) -> None:
+        R_SHUNT = 100
+        alert_gpio = MagicMock()
+        mock_spi = MagicMock(
+            mode=INA229.SPI_MODE,
+            max_speed=INA229.MAX_SPI_MAX_SPEED,
+            bit_order=INA229.SPI_BIT_ORDER,
+            bits_per_word=INA229.SPI_WORD_BIT_COUNT,
+            extra_flags=0,
+        )
+        mock_spi.transfer.side_effect = [
+            bytes(3),
+            bytes([0x00, 0x10, 0x00]),
+        ]
+        ina229 = INA229(R_SHUNT, alert_gpio, mock_spi)
+        mock_spi.reset_mock(side_effect=True)
+
+        self.assertFalse(ina229.ADCRANGE)
+        self.assertEqual(ina229.SHUNT_CAL, 0x1000)
+        mock_spi.transfer.assert_not_called()
+
+        mock_spi.transfer.return_value = bytes([0x00, 0xFF, 0xFF, 0xF0])
+
+        self.assertAlmostEqual(ina229.shunt_voltage, -312.5e-9, 16)
+
+        mock_spi.transfer.return_value = bytes(3)
+        ina229.ADCRANGE = True
+        ina229.SHUNT_CAL = 0x2000
+        mock_spi.transfer.return_value = bytes([0x00, 0xFF, 0xFF, 0xF0])
+
+        self.assertAlmostEqual(ina229.shunt_voltage, -78.125e-9, 16)
+
+        mock_spi.transfer.return_value = bytes(3)
+        mock_spi.reset_mock()
+
+        self.assertTrue(ina229.ADCRANGE)
+        self.assertEqual(ina229.SHUNT_CAL, 0x2000)
+        self.assertAlmostEqual(
+            ina229.CURRENT_LSB / (4 * 0x2000 / (13107.2 * 1e6 * R_SHUNT)),
+            1,
+        )
+        mock_spi.transfer.assert_not_called()
+
+        ina229.reset()
+
+        self.assertFalse(ina229.ADCRANGE)
+        self.assertEqual(ina229.SHUNT_CAL, 0x1000)
+
+        mock_spi.reset_mock()
+        mock_spi.transfer.return_value = bytes([0x00, 0x00, 0x10])
+        ina229.ADCRANGE = True
+
+        self.assertTrue(ina229.ADCRANGE)
+        self.assertAlmostEqual(
+            ina229.CURRENT_LSB / (4 * 0x1000 / (13107.2 * 1e6 * R_SHUNT)),
+            1,
+        )
+        mock_spi.transfer.assert_called_once_with(
+            bytes([0b00000001, 0x00, 0x00]),
+        )
+
+    def test_sample(self) -> None:
+        R_SHUNT = 100
+        alert_gpio = MagicMock()
+        mock_spi = MagicMock(
+            mode=INA229.SPI_MODE,
+            max_speed=INA229.MAX_SPI_MAX_SPEED,
+            bit_order=INA229.SPI_BIT_ORDER,
+            bits_per_word=INA229.SPI_WORD_BIT_COUNT,
+            extra_flags=0,
+        )
+        mock_spi.transfer.return_value = bytes([0x00, 0x10, 0x00])
+        ina229 = INA229(R_SHUNT, alert_gpio, mock_spi)
+        mock_spi.reset_mock()
+        mock_spi.transfer.return_value = bytes(
+            [0x00, 0xFF, 0xFF, 0xF0]
+            + [0x00, 0x00, 0x00, 0x01]
+            + [0x00, 0x00, 0x00, 0x00, 0x00, 0x02]
+            + [0x00, 0xFF, 0xFF, 0xFF, 0xFF, 0xFD],
+        )
+        CURRENT_LSB = ina229.CURRENT_LSB
+        current, power, energy, charge = ina229.sample()
+
+        self.assertAlmostEqual(current / CURRENT_LSB, -1)
+        self.assertAlmostEqual(power / CURRENT_LSB, 3.2)
+        self.assertAlmostEqual(energy / CURRENT_LSB, 2 * 16 * 3.2)
+        self.assertAlmostEqual(charge / CURRENT_LSB, -3)
+        mock_spi.transfer.assert_called_once_with(
+            bytes(
+                [0b00011101, 0x00, 0x00, 0x00]
+                + [0b00100001, 0x00, 0x00, 0x00]
+                + [0b00100101, 0x00, 0x00, 0x00, 0x00, 0x00]
+                + [0b00101001, 0x00, 0x00, 0x00, 0x00, 0x00],
+            ),
+        )
 
 
 if __name__ == '__main__':
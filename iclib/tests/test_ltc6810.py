@@ -9,12 +9,46 @@ class LTC6810TestCase(TestCase):
     def test_get_voltage(self) -> None:
         self.assertAlmostEqual(LTC6810.get_voltage([0xE8, 0x80]), 3.3)
 
+    def test_get_voltages(self) -> None:
+        voltages = LTC6810.get_voltages([0xE8, 0x80, 0x00, 0x00, 0xFF, 0xFF])
+
+        self.assertAlmostEqual(voltages[0], 3.3)
+        self.assertAlmostEqual(voltages[1], 0)
+        self.assertAlmostEqual(voltages[2], 6.5535)
+
     def test_get_packet_error_code_bytes(self) -> None:
         self.assertEqual(
             LTC6810.get_packet_error_code_bytes([0x00, 0x01]),
             (0b00111101, 0b01101110),
         )
 
+    def test_packet_error_code_table(self) -> None:
+        def get_packet_error_code_bytes(
+                data_bytes: list[int],
+        ) -> tuple[int, int]:
+            PEC = 0b000000000010000
+
+            for data_byte in data_bytes:
+                for i in range(7, -1, -1):
+                    IN0 = ((data_byte >> i) ^ (PEC >> 14)) & 1
+                    PEC = (PEC << 1) & ((1 << 15) - 1)
+
+                    if IN0:
+                        PEC ^= 0x4599
+
+            return PEC >> 7, (PEC << 1) & ((1 << 8) - 1)
+
+        for data_byte in range(1 << 8):
+            for data_bytes in (
+                    [data_byte],
+                    [data_byte, 0xFF - data_byte],
+                    [0x00, data_byte, 0xA5, data_byte],
+            ):
+                self.assertEqual(
+                    LTC6810.get_packet_error_code_bytes(data_bytes),
+                    get_packet_error_code_bytes(data_bytes),
+                )
+
     def test_start_cell_voltage_adc_conversion_and_poll_status(self) -> None:
         mock_spi = MagicMock(
             mode=LTC6810.SPI_MODE,
@@ -31,7 +65,7 @@ class LTC6810TestCase(TestCase):
         packet_error_code_bytes = LTC6810.get_packet_error_code_bytes(
             command_bytes,
         )
-        transmitted_bytes = list(command_bytes + packet_error_code_bytes)
+        transmitted_bytes = bytes(command_bytes + packet_error_code_bytes)
 
         mock_spi.transfer.assert_called_once_with(transmitted_bytes)
 
@@ -43,7 +77,7 @@ class LTC6810TestCase(TestCase):
             bits_per_word=LTC6810.SPI_WORD_BIT_COUNT,
             extra_flags=0,
         )
-        mock_spi.transfer.return_value = [0] * 6
+        mock_spi.transfer.return_value = bytes(12)
         ltc6810 = LTC6810(mock_spi)
 
         group = ltc6810.RDCVA(0)
@@ -54,7 +88,7 @@ class LTC6810TestCase(TestCase):
 
         command_bytes = 0b10000000, 0b00000100
         data_bytes = [0xFF] * 6
-        transmitted_bytes = list(
+        transmitted_bytes = bytes(
             chain(
                 command_bytes,
                 LTC6810.get_packet_error_code_bytes(command_bytes),
@@ -73,7 +107,7 @@ class LTC6810TestCase(TestCase):
             bits_per_word=LTC6810.SPI_WORD_BIT_COUNT,
             extra_flags=0,
         )
-        mock_spi.transfer.return_value = [0] * 6
+        mock_spi.transfer.return_value = bytes(12)
         ltc6810 = LTC6810(mock_spi)
 
         group = ltc6810.RDCVB(0)
@@ -84,7 +118,33 @@ class LTC6810TestCase(TestCase):
 
         command_bytes = 0b10000000, 0b00000110
         data_bytes = [0xFF] * 6
-        transmitted_bytes = list(
+        transmitted_bytes = bytes(
+            chain(
+                command_bytes,
+                LTC6810.get_packet_error_code_bytes(command_bytes),
+                data_bytes,
+                LTC6810.get_packet_error_code_bytes(data_bytes),
+            ),
+        )
+
+        mock_spi.transfer.assert_called_once_with(transmitted_bytes)
+
+    def test_write_configuration_register_group(self) -> None:
+        mock_spi = MagicMock(
+            mode=LTC6810.SPI_MODE,
+            max_speed=LTC6810.MIN_SPI_MAX_SPEED,
+            bit_order=LTC6810.SPI_BIT_ORDER,
+            bits_per_word=LTC6810.SPI_WORD_BIT_COUNT,
+            extra_flags=0,
+        )
+        ltc6810 = LTC6810(mock_spi)
+        CFGR = LTC6810.CFGR(REFON=True, VUV=0x123, VOV=0x456, DCC1=True)
+
+        ltc6810.WRCFG(CFGR, 0)
+
+        command_bytes = 0b10000000, 0b00000001
+        data_bytes = [0b00000100, 0x23, 0x61, 0x45, 0b00000001, 0b00000000]
+        transmitted_bytes = bytes(
             chain(
                 command_bytes,
                 LTC6810.get_packet_error_code_bytes(command_bytes),
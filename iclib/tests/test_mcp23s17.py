@@ -1,7 +1,7 @@
 from unittest import TestCase, main
 from unittest.mock import call, MagicMock
 
-from iclib.mcp23s17 import MCP23S17, Mode, Port, Register
+from iclib.mcp23s17 import MCP23S17, Mode, Port, Read, Register, Write
 
 
 class MCP23S17TestCase(TestCase):
@@ -19,7 +19,9 @@ class MCP23S17TestCase(TestCase):
             bits_per_word=MCP23S17.SPI_WORD_BIT_COUNT,
             extra_flags=0,
         )
-        mock_spi.transfer.return_value = [0b11111111, 0b11111111, 0b00000000]
+        mock_spi.transfer.return_value = bytearray(
+            [0b11111111, 0b11111111, 0b00000000],
+        )
         mcp23s17 = MCP23S17(
             mock_hardware_reset_gpio,
             mock_interrupt_output_a_gpio,
@@ -31,22 +33,26 @@ class MCP23S17TestCase(TestCase):
             mcp23s17.read_register(Port.PORTA, Register.INTCON),
             [0b00000000],
         )
-        mock_spi.transfer.assert_called_once_with([0b01000001, 0x08, 0xFF])
+        mock_spi.transfer.assert_called_once_with(
+            bytearray([0b01000001, 0x08, 0xFF]),
+        )
         mock_spi.clear_calls()
         mock_spi.reset_mock()
         self.assertEqual(
             mcp23s17.read_register(Port.PORTB, Register.INTCON),
             [0b00000000],
         )
-        mock_spi.transfer.assert_called_once_with([0b01000001, 0x09, 0xFF])
+        mock_spi.transfer.assert_called_once_with(
+            bytearray([0b01000001, 0x09, 0xFF]),
+        )
         mock_spi.reset_mock()
 
         mcp23s17.mode = Mode.EIGHT_BIT_MODE
 
         mock_spi.transfer.assert_has_calls(
             [
-                call([0b01000001, 0x0A, 0xFF]),
-                call([0b01000000, 0x0A, 0b10000000]),
+                call(bytearray([0b01000001, 0x0A, 0xFF])),
+                call(bytearray([0b01000000, 0x0A, 0b10000000])),
             ],
         )
         mock_spi.reset_mock()
@@ -55,14 +61,255 @@ class MCP23S17TestCase(TestCase):
             mcp23s17.read_register(Port.PORTA, Register.INTCON),
             [0b00000000],
         )
-        mock_spi.transfer.assert_called_once_with([0b01000001, 0x04, 0xFF])
+        mock_spi.transfer.assert_called_once_with(
+            bytearray([0b01000001, 0x04, 0xFF]),
+        )
         mock_spi.clear_calls()
         mock_spi.reset_mock()
         self.assertEqual(
             mcp23s17.read_register(Port.PORTB, Register.INTCON),
             [0b00000000],
         )
-        mock_spi.transfer.assert_called_once_with([0b01000001, 0x14, 0xFF])
+        mock_spi.transfer.assert_called_once_with(
+            bytearray([0b01000001, 0x14, 0xFF]),
+        )
+
+    def test_operate(self) -> None:
+        mock_hardware_reset_gpio = MagicMock()
+        mock_interrupt_output_a_gpio = MagicMock()
+        mock_interrupt_output_b_gpio = MagicMock()
+        mock_spi = MagicMock(
+            mode=MCP23S17.SPI_MODES[0],
+            max_speed=MCP23S17.MAX_SPI_MAX_SPEED,
+            bit_order=MCP23S17.SPI_BIT_ORDER,
+            bits_per_word=MCP23S17.SPI_WORD_BIT_COUNT,
+            extra_flags=0,
+        )
+        mock_spi.transfer.return_value = bytearray(
+            [0xFF, 0xFF, 0x12, 0x34, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x56],
+        )
+        mcp23s17 = MCP23S17(
+            mock_hardware_reset_gpio,
+            mock_interrupt_output_a_gpio,
+            mock_interrupt_output_b_gpio,
+            mock_spi,
+            1,
+        )
+
+        self.assertEqual(
+            mcp23s17.operate(
+                Read(1, 0x12, 2),
+                Write(1, 0x14, b'\xab'),
+                Read(1, 0x00, 1),
+            ),
+            [0x12, 0x34, 0x00, 0x56],
+        )
+        mock_spi.transfer.assert_called_once_with(
+            bytearray(
+                [
+                    0b01000011,
+                    0x12,
+                    0xFF,
+                    0xFF,
+                    0b01000010,
+                    0x14,
+                    0xAB,
+                    0b01000011,
+                    0x00,
+                    0xFF,
+                ],
+            ),
+        )
+
+    def test_sequential_operation(self) -> None:
+        mock_hardware_reset_gpio = MagicMock()
+        mock_interrupt_output_a_gpio = MagicMock()
+        mock_interrupt_output_b_gpio = MagicMock()
+        mock_spi = MagicMock(
+            mode=MCP23S17.SPI_MODES[0],
+            max_speed=MCP23S17.MAX_SPI_MAX_SPEED,
+            bit_order=MCP23S17.SPI_BIT_ORDER,
+            bits_per_word=MCP23S17.SPI_WORD_BIT_COUNT,
+            extra_flags=0,
+        )
+        mock_spi.transfer.return_value = bytearray(
+            [0xFF, 0xFF, 0x12, 0x34],
+        )
+        mcp23s17 = MCP23S17(
+            mock_hardware_reset_gpio,
+            mock_interrupt_output_a_gpio,
+            mock_interrupt_output_b_gpio,
+            mock_spi,
+        )
+
+        self.assertEqual(
+            mcp23s17.operate(Read(0, 0x12, 1), Read(0, 0x13, 1)),
+            [0x12, 0x34],
+        )
+        mock_spi.transfer.assert_called_once_with(
+            bytearray([0b01000001, 0x12, 0xFF, 0xFF]),
+        )
+        mock_spi.reset_mock()
+        mock_spi.transfer.return_value = bytearray(
+            [0xFF, 0xFF, 0xFF, 0xFF],
+        )
+        mcp23s17.operate(Write(0, 0x14, [0x56]), Write(0, 0x15, b'\x78'))
+        mock_spi.transfer.assert_called_once_with(
+            bytearray([0b01000000, 0x14, 0x56, 0x78]),
+        )
+        mock_spi.reset_mock()
+        mock_spi.transfer.return_value = bytearray([0xFF, 0xFF, 0x00])
+
+        mcp23s17.sequential_operation = False
+
+        mock_spi.transfer.assert_has_calls(
+            [
+                call(bytearray([0b01000001, 0x0A, 0xFF])),
+                call(bytearray([0b01000000, 0x0A, 0b00100000])),
+            ],
+        )
+        mock_spi.reset_mock()
+        mock_spi.transfer.return_value = bytearray(
+            [0xFF, 0xFF, 0x12, 0xFF, 0xFF, 0x34],
+        )
+        self.assertEqual(
+            mcp23s17.operate(Read(0, 0x12, 1), Read(0, 0x13, 1)),
+            [0x12, 0x34],
+        )
+        mock_spi.transfer.assert_called_once_with(
+            bytearray([0b01000001, 0x12, 0xFF, 0b01000001, 0x13, 0xFF]),
+        )
+
+    def test_cache(self) -> None:
+        mock_hardware_reset_gpio = MagicMock()
+        mock_interrupt_output_a_gpio = MagicMock()
+        mock_interrupt_output_b_gpio = MagicMock()
+        mock_spi = MagicMock(
+            mode=MCP23S17.SPI_MODES[0],
+            max_speed=MCP23S17.MAX_SPI_MAX_SPEED,
+            bit_order=MCP23S17.SPI_BIT_ORDER,
+            bits_per_word=MCP23S17.SPI_WORD_BIT_COUNT,
+            extra_flags=0,
+        )
+        mock_spi.transfer.return_value = bytearray([0xFF, 0xFF, 0xFF])
+        mcp23s17 = MCP23S17(
+            mock_hardware_reset_gpio,
+            mock_interrupt_output_a_gpio,
+            mock_interrupt_output_b_gpio,
+            mock_spi,
+        )
+
+        self.assertEqual(
+            mcp23s17.read_register(Port.PORTA, Register.IODIR),
+            [0xFF],
+        )
+        self.assertEqual(
+            mcp23s17.read_register(Port.PORTA, Register.IODIR),
+            [0xFF],
+        )
+        mock_spi.transfer.assert_called_once_with(
+            bytearray([0b01000001, 0x00, 0xFF]),
+        )
+        mock_spi.reset_mock()
+
+        mcp23s17.write_bit(Port.PORTA, Register.IODIR, 0, False)
+        mcp23s17.write_bit(Port.PORTA, Register.IODIR, 0, False)
+
+        mock_spi.transfer.assert_called_once_with(
+            bytearray([0b01000000, 0x00, 0b11111110]),
+        )
+        mock_spi.reset_mock()
+
+        mcp23s17.write_register(Port.PORTB, Register.GPIO, [0x5A])
+
+        self.assertEqual(
+            mcp23s17.read_register(Port.PORTB, Register.OLAT),
+            [0x5A],
+        )
+        mock_spi.transfer.assert_called_once_with(
+            bytearray([0b01000000, 0x13, 0x5A]),
+        )
+        mock_spi.reset_mock()
+        mcp23s17.read_register(Port.PORTB, Register.GPIO)
+        mcp23s17.read_register(Port.PORTB, Register.GPIO)
+        self.assertEqual(mock_spi.transfer.call_count, 2)
+        mock_spi.reset_mock()
+        mock_spi.transfer.return_value = bytearray([0xFF, 0xFF, 0x00])
+
+        mcp23s17.mode = Mode.EIGHT_BIT_MODE
+
+        mock_spi.transfer.assert_has_calls(
+            [
+                call(bytearray([0b01000001, 0x0A, 0xFF])),
+                call(bytearray([0b01000000, 0x0A, 0b10000000])),
+            ],
+        )
+        mock_spi.reset_mock()
+        mcp23s17.read_register(Port.PORTA, Register.IODIR)
+        mock_spi.transfer.assert_called_once_with(
+            bytearray([0b01000001, 0x00, 0xFF]),
+        )
+
+    def test_cache_byte_mode(self) -> None:
+        mock_hardware_reset_gpio = MagicMock()
+        mock_interrupt_output_a_gpio = MagicMock()
+        mock_interrupt_output_b_gpio = MagicMock()
+        mock_spi = MagicMock(
+            mode=MCP23S17.SPI_MODES[0],
+            max_speed=MCP23S17.MAX_SPI_MAX_SPEED,
+            bit_order=MCP23S17.SPI_BIT_ORDER,
+            bits_per_word=MCP23S17.SPI_WORD_BIT_COUNT,
+            extra_flags=0,
+        )
+        mock_spi.transfer.return_value = bytearray([0xFF, 0xFF, 0x00])
+        mcp23s17 = MCP23S17(
+            mock_hardware_reset_gpio,
+            mock_interrupt_output_a_gpio,
+            mock_interrupt_output_b_gpio,
+            mock_spi,
+        )
+
+        mcp23s17.sequential_operation = False
+        mock_spi.reset_mock()
+        mock_spi.transfer.return_value = bytearray(5)
+        mcp23s17.write(0x00, [0x12, 0x34, 0x56])
+
+        self.assertEqual(
+            mcp23s17.read_register(Port.PORTA, Register.IODIR),
+            [0x56],
+        )
+        self.assertEqual(
+            mcp23s17.read_register(Port.PORTB, Register.IODIR),
+            [0x34],
+        )
+        mock_spi.transfer.assert_called_once_with(
+            bytearray([0b01000000, 0x00, 0x12, 0x34, 0x56]),
+        )
+        mock_spi.reset_mock()
+        mock_spi.transfer.return_value = bytearray([0xFF, 0xFF, 0x00])
+        mcp23s17.read_register(Port.PORTA, Register.IPOL)
+        mock_spi.transfer.assert_called_once_with(
+            bytearray([0b01000001, 0x02, 0xFF]),
+        )
+        mock_spi.transfer.return_value = bytearray(4)
+
+        mcp23s17.mode = Mode.EIGHT_BIT_MODE
+        mock_spi.reset_mock()
+        mcp23s17.write(0x00, [0x12, 0x34])
+
+        self.assertEqual(
+            mcp23s17.read_register(Port.PORTA, Register.IODIR),
+            [0x34],
+        )
+        mock_spi.transfer.assert_called_once_with(
+            bytearray([0b01000000, 0x00, 0x12, 0x34]),
+        )
+        mock_spi.reset_mock()
+        mock_spi.transfer.return_value = bytearray([0xFF, 0xFF, 0x00])
+        mcp23s17.read_register(Port.PORTA, Register.IPOL)
+        mock_spi.transfer.assert_called_once_with(
+            bytearray([0b01000001, 0x01, 0xFF]),
+        )
 
 
 if __name__ == '__main__':
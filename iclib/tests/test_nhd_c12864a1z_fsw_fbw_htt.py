@@ -0,0 +1,312 @@
+from unittest import TestCase, main
+from unittest.mock import call, MagicMock, patch
+
+from iclib.nhd_c12864a1z_fsw_fbw_htt import NHDC12864A1ZFSWFBWHTT
+
+
+class NHDC12864A1ZFSWFBWHTTTestCase(TestCase):
+    def test_display(self) -> None:
+        mock_spi = MagicMock(
+            mode=NHDC12864A1ZFSWFBWHTT.SPI_MODE,
+            max_speed=NHDC12864A1ZFSWFBWHTT.MAX_SPI_MAX_SPEED,
+            bit_order=NHDC12864A1ZFSWFBWHTT.SPI_BIT_ORDER,
+            extra_flags=0,
+        )
+        mock_a0_pin = MagicMock()
+        mock_reset_pin = MagicMock()
+        display = NHDC12864A1ZFSWFBWHTT(
+            mock_spi,
+            mock_a0_pin,
+            mock_reset_pin,
+        )
+
+        display.write_pixel(0, 0)
+        display.write_pixel(127, 63)
+        display.display()
+
+        page_0 = bytearray(128)
+        page_0[0] = 0b00000001
+        page_7 = bytearray(128)
+        page_7[127] = 0b10000000
+        calls = [call(b'\xae\x40')]
+
+        for i in range(8):
+            if i == 0:
+                page = page_0
+            elif i == 7:
+                page = page_7
+            else:
+                page = bytearray(128)
+
+            calls.extend([call(bytes((0xB0 + i, 0x10, 0x00))), call(page)])
+
+        calls.append(call(b'\xaf\xa5\xa4'))
+
+        self.assertEqual(mock_spi.transfer.call_args_list, calls)
+        self.assertEqual(
+            mock_a0_pin.write.call_args_list,
+            [call(False)] + [call(True), call(False)] * 8,
+        )
+
+    def test_display_dirty_columns(self) -> None:
+        mock_spi = MagicMock(
+            mode=NHDC12864A1ZFSWFBWHTT.SPI_MODE,
+            max_speed=NHDC12864A1ZFSWFBWHTT.MAX_SPI_MAX_SPEED,
+            bit_order=NHDC12864A1ZFSWFBWHTT.SPI_BIT_ORDER,
+            extra_flags=0,
+        )
+        mock_a0_pin = MagicMock()
+        mock_reset_pin = MagicMock()
+        display = NHDC12864A1ZFSWFBWHTT(
+            mock_spi,
+            mock_a0_pin,
+            mock_reset_pin,
+        )
+
+        display.display()
+        mock_spi.reset_mock()
+        display.write_pixel(5, 10)
+        display.write_pixel(9, 12)
+        display.display()
+
+        self.assertEqual(
+            mock_spi.transfer.call_args_list,
+            [
+                call(b'\xae\x40'),
+                call(b'\xb1\x10\x05'),
+                call(bytearray([0b00000100, 0, 0, 0, 0b00010000])),
+                call(b'\xaf\xa5\xa4'),
+            ],
+        )
+        mock_spi.reset_mock()
+        display.display()
+
+        self.assertEqual(
+            mock_spi.transfer.call_args_list,
+            [call(b'\xae\x40'), call(b'\xaf\xa5\xa4')],
+        )
+
+    def test_mark_dirty(self) -> None:
+        mock_spi = MagicMock(
+            mode=NHDC12864A1ZFSWFBWHTT.SPI_MODE,
+            max_speed=NHDC12864A1ZFSWFBWHTT.MAX_SPI_MAX_SPEED,
+            bit_order=NHDC12864A1ZFSWFBWHTT.SPI_BIT_ORDER,
+            extra_flags=0,
+        )
+        mock_a0_pin = MagicMock()
+        mock_reset_pin = MagicMock()
+        display = NHDC12864A1ZFSWFBWHTT(
+            mock_spi,
+            mock_a0_pin,
+            mock_reset_pin,
+        )
+
+        display.display()
+        display.framebuffer[:] = b'\xff' * 1024
+        display.mark_dirty()
+        mock_spi.reset_mock()
+        display.display()
+
+        calls = [call(b'\xae\x40')]
+
+        for i in range(8):
+            calls.extend(
+                [
+                    call(bytes((0xB0 + i, 0x10, 0x00))),
+                    call(bytearray(b'\xff' * 128)),
+                ],
+            )
+
+        calls.append(call(b'\xaf\xa5\xa4'))
+
+        self.assertEqual(mock_spi.transfer.call_args_list, calls)
+
+    def test_write_pixel_immediate(self) -> None:
+        mock_spi = MagicMock(
+            mode=NHDC12864A1ZFSWFBWHTT.SPI_MODE,
+            max_speed=NHDC12864A1ZFSWFBWHTT.MAX_SPI_MAX_SPEED,
+            bit_order=NHDC12864A1ZFSWFBWHTT.SPI_BIT_ORDER,
+            extra_flags=0,
+        )
+        mock_a0_pin = MagicMock()
+        mock_reset_pin = MagicMock()
+        display = NHDC12864A1ZFSWFBWHTT(
+            mock_spi,
+            mock_a0_pin,
+            mock_reset_pin,
+        )
+
+        display.write_pixel_immediate(0x25, 3)
+
+        self.assertEqual(
+            mock_spi.transfer.call_args_list,
+            [call(b'\xb0\x12\x05'), call(bytearray([0b00001000]))],
+        )
+
+    def test_clear_screen(self) -> None:
+        mock_spi = MagicMock(
+            mode=NHDC12864A1ZFSWFBWHTT.SPI_MODE,
+            max_speed=NHDC12864A1ZFSWFBWHTT.MAX_SPI_MAX_SPEED,
+            bit_order=NHDC12864A1ZFSWFBWHTT.SPI_BIT_ORDER,
+            extra_flags=0,
+        )
+        mock_a0_pin = MagicMock()
+        mock_reset_pin = MagicMock()
+        display = NHDC12864A1ZFSWFBWHTT(
+            mock_spi,
+            mock_a0_pin,
+            mock_reset_pin,
+        )
+
+        display.draw_fill_rect(0, 0, 128, 64)
+
+        self.assertEqual(display.framebuffer, b'\xff' * 1024)
+
+        display.clear_screen()
+
+        self.assertIsInstance(display.framebuffer, bytearray)
+        self.assertEqual(display.framebuffer, bytes(1024))
+
+    def test_pixel_in_bounds(self) -> None:
+        mock_spi = MagicMock(
+            mode=NHDC12864A1ZFSWFBWHTT.SPI_MODE,
+            max_speed=NHDC12864A1ZFSWFBWHTT.MAX_SPI_MAX_SPEED,
+            bit_order=NHDC12864A1ZFSWFBWHTT.SPI_BIT_ORDER,
+            extra_flags=0,
+        )
+        mock_a0_pin = MagicMock()
+        mock_reset_pin = MagicMock()
+        display = NHDC12864A1ZFSWFBWHTT(
+            mock_spi,
+            mock_a0_pin,
+            mock_reset_pin,
+        )
+
+        self.assertTrue(display.pixel_in_bounds(0, 0))
+        self.assertTrue(display.pixel_in_bounds(127, 63))
+        self.assertFalse(display.pixel_in_bounds(128, 0))
+        self.assertFalse(display.pixel_in_bounds(0, 64))
+        self.assertFalse(display.pixel_in_bounds(-1, 0))
+
+        display.write_pixel(128, 0)
+        display.write_pixel(-1, 63)
+        display.write_pixel_immediate(0, 64)
+
+        self.assertEqual(display.framebuffer, bytes(1024))
+        mock_spi.transfer.assert_not_called()
+
+    def test_draw_rect(self) -> None:
+        mock_spi = MagicMock(
+            mode=NHDC12864A1ZFSWFBWHTT.SPI_MODE,
+            max_speed=NHDC12864A1ZFSWFBWHTT.MAX_SPI_MAX_SPEED,
+            bit_order=NHDC12864A1ZFSWFBWHTT.SPI_BIT_ORDER,
+            extra_flags=0,
+        )
+        mock_a0_pin = MagicMock()
+        mock_reset_pin = MagicMock()
+        display = NHDC12864A1ZFSWFBWHTT(
+            mock_spi,
+            mock_a0_pin,
+            mock_reset_pin,
+        )
+
+        display.draw_rect(2, 6, 4, 12)
+
+        framebuffer = bytearray(1024)
+        framebuffer[2:6] = 0b11000000, 0b01000000, 0b01000000, 0b11000000
+        framebuffer[130:134] = 0b11111111, 0b00000000, 0b00000000, 0b11111111
+        framebuffer[258:262] = 0b00000011, 0b00000010, 0b00000010, 0b00000011
+
+        self.assertEqual(display.framebuffer, framebuffer)
+
+    def test_draw_letter(self) -> None:
+        mock_spi = MagicMock(
+            mode=NHDC12864A1ZFSWFBWHTT.SPI_MODE,
+            max_speed=NHDC12864A1ZFSWFBWHTT.MAX_SPI_MAX_SPEED,
+            bit_order=NHDC12864A1ZFSWFBWHTT.SPI_BIT_ORDER,
+            extra_flags=0,
+        )
+        mock_a0_pin = MagicMock()
+        mock_reset_pin = MagicMock()
+        display = NHDC12864A1ZFSWFBWHTT(
+            mock_spi,
+            mock_a0_pin,
+            mock_reset_pin,
+        )
+
+        with patch('iclib.nhd_c12864a1z_fsw_fbw_htt.Face') as mock_face:
+            display.set_font('font.ttf')
+
+        mock_face.return_value.glyph.bitmap = MagicMock(
+            rows=10,
+            width=3,
+            pitch=4,
+            buffer=[0xFF, 0xFF, 0x00, 0x00] + [0xFF, 0x00, 0x00, 0x00] * 9,
+        )
+        display.set_size(3, 10)
+        display.framebuffer[:] = b'\xff' * 1024
+
+        display.draw_letter('A', 1, 5)
+
+        framebuffer = bytearray(b'\xff' * 1024)
+        framebuffer[1:4] = 0b11111111, 0b00111111, 0b00011111
+        framebuffer[129:132] = 0b11111111, 0b10000000, 0b10000000
+
+        self.assertEqual(display.framebuffer, framebuffer)
+
+        display.draw_letter('A', 1, 5)
+
+        mock_face.return_value.load_char.assert_called_once_with('A')
+        self.assertEqual(display.framebuffer, framebuffer)
+
+        display.set_size(3, 10)
+        display.draw_letter('A', 1, 5)
+
+        self.assertEqual(mock_face.return_value.load_char.call_count, 2)
+
+    def test_draw_word(self) -> None:
+        mock_spi = MagicMock(
+            mode=NHDC12864A1ZFSWFBWHTT.SPI_MODE,
+            max_speed=NHDC12864A1ZFSWFBWHTT.MAX_SPI_MAX_SPEED,
+            bit_order=NHDC12864A1ZFSWFBWHTT.SPI_BIT_ORDER,
+            extra_flags=0,
+        )
+        mock_a0_pin = MagicMock()
+        mock_reset_pin = MagicMock()
+        display = NHDC12864A1ZFSWFBWHTT(
+            mock_spi,
+            mock_a0_pin,
+            mock_reset_pin,
+        )
+
+        with patch('iclib.nhd_c12864a1z_fsw_fbw_htt.Face'):
+            display.set_font('font.ttf')
+
+        display.set_size(50, 32)
+
+        with patch.object(display, 'draw_letter') as mock_draw_letter:
+            display.draw_word('abcde', 0, 0)
+
+        self.assertEqual(
+            mock_draw_letter.call_args_list,
+            [
+                call('a', 0, 0),
+                call('b', 50, 0),
+                call('c', 0, 32),
+                call('d', 50, 32),
+            ],
+        )
+
+        display.set_size(10, 20)
+
+        with patch.object(display, 'draw_letter') as mock_draw_letter:
+            display.draw_word('abcde', 100, 30)
+
+        self.assertEqual(
+            mock_draw_letter.call_args_list,
+            [call('a', 100, 30), call('b', 110, 30)],
+        )
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
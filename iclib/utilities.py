@@ -4,14 +4,15 @@ from collections.abc import Callable
 
 
 def bit_getter(index: int) -> Callable[[int], bool]:
-    return lambda value: bool(value & (1 << index))
+    mask = 1 << index
+
+    return lambda value: bool(value & mask)
 
 
 def twos_complement(value: int, bit_count: int) -> int:
-    if value & (1 << (bit_count - 1)):
-        value -= (1 << bit_count)
+    sign_bit = 1 << (bit_count - 1)
 
-    return value
+    return (value ^ sign_bit) - sign_bit
 
 
 def lsb_bits_to_byte(*bits: bool) -> int: